@@ -137,6 +137,39 @@ def _check_metainfo(content_path, piece_size, exp_infohash, exp_pieces):
     assert t.metainfo['info']['piece length'] == piece_size
 
 
+def test_process_backend(create_dir, random_seed):
+    with random_seed(0):
+        content_path = create_dir('content',
+                                  ('a.jpg', torf.Torrent.piece_size_min * 1.123),
+                                  ('b.jpg', torf.Torrent.piece_size_min * 2.456),
+                                  ('c.jpg', torf.Torrent.piece_size_min * 3.789))
+    t = torf.Torrent(content_path)
+    assert t.generate(threads=2) is True
+    exp_hashes = t.hashes
+    assert t.generate(threads=2, backend='process') is True
+    assert t.hashes == exp_hashes
+
+def test_use_mmap(filespecs, piece_size, create_file, create_dir, forced_piece_size):
+    display_filespecs(filespecs, piece_size)
+    if len(filespecs) == 1:
+        content_path = create_file(filespecs[0][0], filespecs[0][1])
+    else:
+        content_path = create_dir('content', *filespecs)
+    with forced_piece_size(piece_size):
+        t = torf.Torrent(content_path)
+        assert t.generate() is True
+        exp_hashes = t.hashes
+        assert t.generate(use_mmap=True) is True
+        assert t.hashes == exp_hashes
+
+def test_invalid_backend(create_file):
+    content_path = create_file('file.jpg', '<image data>')
+    t = torf.Torrent(content_path)
+    with pytest.raises(ValueError) as e:
+        t.generate(backend='foo')
+    assert str(e.value) == "Invalid backend: 'foo'"
+
+
 def test_callback_is_called_with_correct_arguments(filespecs, piece_size, create_file, create_dir, forced_piece_size):
     display_filespecs(filespecs, piece_size)
     if len(filespecs) == 1:
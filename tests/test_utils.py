@@ -47,6 +47,31 @@ def test_read_chunks__prepend_bytes_to_file(create_file):
     assert tuple(utils.read_chunks(filepath, 3, prepend=b'12345')) == (b'123', b'45a', b'bcd', b'efg', b'hij')
     assert tuple(utils.read_chunks(filepath, 3, prepend=b'123456')) == (b'123', b'456', b'abc', b'def', b'ghi', b'j')
 
+def test_read_chunks_mmap__unreadable_file():
+    with pytest.raises(torf.ReadError) as excinfo:
+        tuple(utils.read_chunks_mmap('no/such/file', 10))
+    assert excinfo.match(r'^no/such/file: No such file or directory$')
+
+def test_read_chunks_mmap__empty_file(create_file):
+    filepath = create_file('some_file', '')
+    assert tuple(utils.read_chunks_mmap(filepath, 4)) == ()
+    assert tuple(bytes(c) for c in utils.read_chunks_mmap(filepath, 4, prepend=b'12')) == (b'12',)
+
+def test_read_chunks_mmap__yields_memoryviews(create_file):
+    filepath = create_file('some_file', ALPHABET[:10])
+    chunks = tuple(utils.read_chunks_mmap(filepath, 4))
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert tuple(bytes(chunk) for chunk in chunks) == (b'abcd', b'efgh', b'ij')
+
+def test_read_chunks_mmap__prepend_bytes_to_file(create_file):
+    filepath = create_file('some_file', ALPHABET[:10])
+    for chunksize in range(1, 12):
+        for prepend in (b'', b'1', b'12', b'123', b'1234', b'12345', b'123456'):
+            exp_chunks = tuple(utils.read_chunks(filepath, chunksize, prepend=prepend))
+            chunks = tuple(bytes(chunk) for chunk in
+                           utils.read_chunks_mmap(filepath, chunksize, prepend=prepend))
+            assert chunks == exp_chunks
+
 
 def test_is_power_of_2():
     assert utils.is_power_of_2(0) is False
@@ -78,7 +78,7 @@ class _TestCaseBase():
             if hasattr(self, attr):
                 delattr(self, attr)
 
-    def run(self, *_, with_callback, exp_return_value=None, skip_file_on_first_error=False):
+    def run(self, *_, with_callback, exp_return_value=None, skip_file_on_first_error=False, **verify_kwargs):
         debug(f'Original stream: {self.stream_original.hex()}')
         debug(f' Corrupt stream: {self.stream_corrupt.hex()}')
         debug(f'Corruption positions: {self.corruption_positions}')
@@ -86,7 +86,8 @@ class _TestCaseBase():
 
         self.skip_file_on_first_error = skip_file_on_first_error
         kwargs = {'skip_file_on_first_error': skip_file_on_first_error,
-                  'exp_return_value': exp_return_value}
+                  'exp_return_value': exp_return_value,
+                  **verify_kwargs}
         if not with_callback:
             exp_exceptions = self.exp_exceptions
             if not exp_exceptions:
@@ -515,6 +516,27 @@ def test_verify_content_with_changed_file_size_and_skipping(mktestcase, piece_si
                 skip_file_on_first_error=True,
                 exp_return_value=False)
 
+def test_verify_content_with_random_corruptions_and_process_backend(mktestcase, piece_size, callback, filespecs):
+    display_filespecs(filespecs, piece_size)
+    tc = mktestcase(filespecs, piece_size)
+    tc.corrupt_stream()
+    cb = tc.run(with_callback=callback['enabled'],
+                skip_file_on_first_error=True,
+                backend='process',
+                exp_return_value=False)
+
+def test_verify_content_with_multiple_error_types_and_mmap(mktestcase, piece_size, callback, filespecs):
+    display_filespecs(filespecs, piece_size)
+    tc = mktestcase(filespecs, piece_size)
+    errorizers = [tc.corrupt_stream, tc.delete_file, tc.change_file_size]
+    for _ in range(random.randint(2, len(errorizers))):
+        errorizer = errorizers.pop(random.choice(range(len(errorizers))))
+        errorizer()
+    cb = tc.run(with_callback=callback['enabled'],
+                skip_file_on_first_error=random.choice((True, False)),
+                use_mmap=True,
+                exp_return_value=False)
+
 def test_verify_content_with_multiple_error_types(mktestcase, piece_size, callback, filespecs):
     display_filespecs(filespecs, piece_size)
     tc = mktestcase(filespecs, piece_size)
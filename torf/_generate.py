@@ -18,15 +18,23 @@ from hashlib import sha1
 import threading
 import queue
 import os
+import concurrent.futures
+import functools
 from time import monotonic as time_monotonic
 from collections import defaultdict
 from . import _errors as error
 
+# multiprocessing.shared_memory is only available since Python 3.8.
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
 import logging
 _debug = logging.getLogger('torf').debug
 
 def _pretty_bytes(b):
-    if isinstance(b, (bytes, bytearray)):
+    if isinstance(b, (bytes, bytearray, memoryview)):
         if len(b) > 8:
             return b[:8].hex() + '...' + b[-8:].hex()
         else:
@@ -81,6 +89,36 @@ class ExhaustableQueue(queue.Queue):
             return self.__is_exhausted
 
 
+class BufferPool():
+    """
+    Fixed number of preallocated `bytearray`s of `size` bytes
+
+    `get` blocks until a buffer is available.  Once `exhausted` is called, `get`
+    raises `queue.Empty` and `put` does nothing.
+    """
+    def __init__(self, count, size):
+        assert count > 0, count
+        buffers = [bytearray(size) for _ in range(count)]
+        self._buffers = {id(buf): buf for buf in buffers}
+        self._queue = ExhaustableQueue(name='buffers')
+        for buf in buffers:
+            self._queue.put(buf)
+
+    def get(self):
+        return self._queue.get()
+
+    def put(self, buf):
+        # Ignore anything that isn't ours (e.g. bytes or None)
+        if self._buffers.get(id(buf)) is buf:
+            try:
+                self._queue.put(buf)
+            except queue.Empty:
+                pass
+
+    def exhausted(self):
+        self._queue.exhausted()
+
+
 class Worker():
     def __init__(self, name, worker):
         self._exception = None
@@ -112,14 +150,24 @@ class Worker():
 
 
 class Reader():
-    def __init__(self, filepaths, piece_size, queue_size,
+    def __init__(self, filepaths, piece_size, pool_size,
                  file_sizes=defaultdict(lambda: None),
-                 skip_file_on_first_error=False):
+                 skip_file_on_first_error=False, use_mmap=False):
         self._filepaths = tuple(filepaths)
         assert self._filepaths, 'No file paths given'
         self._file_sizes = file_sizes
         self._piece_size = piece_size
-        self._piece_queue = ExhaustableQueue(name='pieces', maxsize=queue_size)
+        # Pieces are read into `pool_size` recycled buffers, which limits how
+        # many pieces can wait for a hasher.  Memory-mapped pieces don't need
+        # buffers.  Pieces without data (e.g. fakes) are limited by the queue.
+        if use_mmap:
+            self._buffer_pool = None
+            self._read_chunks = utils.read_chunks_mmap
+        else:
+            self._buffer_pool = BufferPool(pool_size, piece_size)
+            self._read_chunks = functools.partial(utils.read_chunks_into,
+                                                  buffers=self._buffer_pool)
+        self._piece_queue = ExhaustableQueue(name='pieces', maxsize=pool_size)
         self._bytes_chunked = 0  # Number of bytes sent off as piece_size'd chunks
         self._fake = _FileFaker(self, self._filepaths, file_sizes, piece_size)
         self._skip_file_on_first_error = skip_file_on_first_error
@@ -194,7 +242,7 @@ class Reader():
         try:
             # Read piece_size'd chunks from filepath.  Insert the last bytes
             # from the previous file at the beginning.
-            chunks = utils.read_chunks(filepath, piece_size,
+            chunks = self._read_chunks(filepath, piece_size,
                                        prepend=trailing_bytes)
             for chunk in chunks:
                 _debug(f'reader: Read {len(chunk)} bytes from {os.path.basename(filepath)}: {_pretty_bytes(chunk)}')
@@ -223,6 +271,9 @@ class Reader():
                         # Last chunk in file might be shorter than piece_size
                         trailing_bytes = chunk
 
+        except queue.Empty:
+            # Buffer pool was exhausted by stop()
+            _debug(f'reader: Found exhausted buffer pool while reading from {os.path.basename(filepath)}')
         except Exception as exc:
             if self._file_sizes[filepath] is None:
                 # We cannot calculate piece_index unless we know file's size,
@@ -294,6 +345,7 @@ class Reader():
     def _push(self, piece_index, piece=None, filepath=None, exc=None):
         if self._stop:
             _debug(f'reader: Found stop signal just before sending piece_index {piece_index}')
+            self._release(piece)
             return
         elif piece_index in self._forced_error_piece_indexes \
              and exc is None and piece is not None:
@@ -302,10 +354,16 @@ class Reader():
             # precedence over corruption errors.  Ignore faked pieces (`piece`
             # is None) because they only exist to report progress.
             _debug(f'reader: Forcing hash mismatch for piece_index {piece_index} (original piece: {piece}, exc: {exc})')
+            self._release(piece)
             piece = b''
-        elif piece is not None:
+        elif piece is not None and not isinstance(piece, (bytes, memoryview)):
             piece = bytes(piece)
-        self._piece_queue.put((int(piece_index), piece, filepath, exc))
+        try:
+            self._piece_queue.put((int(piece_index), piece, filepath, exc))
+        except queue.Empty:
+            _debug(f'reader: Piece queue was exhausted while sending piece_index {piece_index}')
+            self._release(piece)
+            return
         _debug(f'reader: >>> Pushed piece_index {piece_index}: '
                f'{_pretty_bytes(piece)}, {os.path.basename(filepath)}, {exc}')
 
@@ -314,12 +372,27 @@ class Reader():
             _debug(f'reader: Setting stop flag')
             self._stop = True
             self._fake.stop = True
+            # Unblock _push() if the piece queue is full and nobody is
+            # consuming it anymore and unblock _read_file() if all buffers are
+            # in use
+            self._piece_queue.exhausted()
+            if self._buffer_pool is not None:
+                self._buffer_pool.exhausted()
         return self
 
+    def _release(self, piece):
+        if self._buffer_pool is not None:
+            self._buffer_pool.put(piece)
+
     @property
     def piece_queue(self):
         return self._piece_queue
 
+    @property
+    def buffer_pool(self):
+        """BufferPool that hashers must return pieces to or `None`"""
+        return self._buffer_pool
+
 
 class _FileFaker():
     # Pretend to read `filepath` to properly report progress and read following
@@ -551,9 +624,10 @@ class _FileFaker():
 
 
 class HasherPool():
-    def __init__(self, workers_count, piece_queue, file_was_skipped=None):
+    def __init__(self, workers_count, piece_queue, file_was_skipped=None, buffer_pool=None):
         self._piece_queue = piece_queue
         self._hash_queue = ExhaustableQueue(name='hashes')
+        self._buffer_pool = buffer_pool
         if file_was_skipped is not None:
             self._file_was_skipped = file_was_skipped
         else:
@@ -573,7 +647,12 @@ class HasherPool():
                 # _debug(f'{name}: {piece_queue} is exhausted')
                 break
             else:
-                self._work(*task)
+                try:
+                    self._work(*task)
+                finally:
+                    # Return piece buffer after it is hashed
+                    if self._buffer_pool is not None:
+                        self._buffer_pool.put(task[1])
         # _debug(f'{name}: Bye, piece_queue has {piece_queue.qsize()} items left')
 
     def _work(self, piece_index, piece, filepath, exc):
@@ -587,11 +666,14 @@ class HasherPool():
             self._hash_queue.put((piece_index, None, filepath, None))
         else:
             # _debug(f'{name}: Hashing piece_index {piece_index}: {piece if piece is None else piece.hex()}')
-            piece_hash = sha1(piece).digest() if piece is not None else None
+            piece_hash = self._hash(piece) if piece is not None else None
             # _debug(f'{name}: Sending hash of piece_index {piece_index}: '
             #        f'{piece_hash if piece_hash is None else piece_hash.hex()}')
             self._hash_queue.put((piece_index, piece_hash, filepath, exc))
 
+    def _hash(self, piece):
+        return sha1(piece).digest()
+
     def stop(self):
         if not self._stop:
             # _debug(f'hasherpool: Setting stop flag')
@@ -611,6 +693,69 @@ class HasherPool():
         return self._hash_queue
 
 
+# Shared memory blocks that were attached by a hashing process, mapped by name
+_attached_shms = {}
+
+def _sha1_shm(name, length):
+    # Runs in a worker process of ProcessHasherPool
+    try:
+        shm = _attached_shms[name]
+    except KeyError:
+        shm = _attached_shms[name] = shared_memory.SharedMemory(name=name)
+    return sha1(shm.buf[:length]).digest()
+
+class ProcessHasherPool(HasherPool):
+    """
+    HasherPool that hashes pieces in a pool of processes
+
+    Each hasher thread owns a shared memory block.  Pieces are copied into it
+    and only its name and the piece length are sent to a worker process, so
+    piece data is never pickled.
+    """
+    def __init__(self, workers_count, piece_queue, file_was_skipped=None, buffer_pool=None):
+        if shared_memory is None:
+            raise RuntimeError('Hashing pieces in processes requires Python 3.8 or newer')
+        self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers_count)
+        self._shms = []
+        self._shms_lock = threading.Lock()
+        self._local = threading.local()
+        super().__init__(workers_count, piece_queue, file_was_skipped=file_was_skipped,
+                         buffer_pool=buffer_pool)
+
+    def _get_shm(self, size):
+        shm = getattr(self._local, 'shm', None)
+        if shm is None or shm.size < size:
+            # Pieces only get smaller after the first one, so this should
+            # happen once per thread
+            shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+            with self._shms_lock:
+                self._shms.append(shm)
+            self._local.shm = shm
+        return shm
+
+    def _hash(self, piece):
+        length = len(piece)
+        shm = self._get_shm(length)
+        shm.buf[:length] = piece
+        return self._executor.submit(_sha1_shm, shm.name, length).result()
+
+    def join(self):
+        try:
+            super().join()
+        finally:
+            self._executor.shutdown(wait=True)
+            with self._shms_lock:
+                for shm in self._shms:
+                    shm.close()
+                    shm.unlink()
+                self._shms.clear()
+        return self
+
+
+HASHER_POOLS = {'thread': HasherPool,
+                'process': ProcessHasherPool}
+
+
 class Collector(Worker):
     def __init__(self, hash_queue, callback=None, file_was_skipped=None):
         self._hash_queue = hash_queue
@@ -915,7 +915,8 @@ class Torrent():
         else:
             return True
 
-    def generate(self, threads=None, callback=None, interval=0):
+    def generate(self, threads=None, callback=None, interval=0, backend='thread',
+                 use_mmap=False):
         """
         Hash pieces and report progress to `callback`
 
@@ -937,15 +938,23 @@ class Torrent():
             stopped.
         :param float interval: Minimum number of seconds between calls to
             `callback`; if 0, `callback` is called once per hashed piece
+        :param str backend: ``"thread"`` to hash pieces in `threads` threads
+            or ``"process"`` to hash pieces in `threads` processes that get
+            piece data via shared memory (requires Python 3.8 or newer)
+        :param bool use_mmap: Whether to pass slices of memory-mapped files to
+            the hashers instead of reading into new buffers; files must not be
+            truncated while they are hashed
 
         :raises PathError: if :attr:`path` contains only empty files/directories
         :raises ReadError: if :attr:`path` or any file beneath it is not
             readable
         :raises RuntimeError: if :attr:`path` is None
+        :raises ValueError: if `backend` is not known
 
         :return: ``True`` if all pieces were successfully hashed, ``False``
             otherwise
         """
+        HasherPool = self._get_hasher_pool(backend)
         self.metainfo['info']['pieces'] = bytes()
         filepaths = self.filepaths
 
@@ -963,11 +972,13 @@ class Torrent():
         # Read piece_size'd chunks from disk and push them to queue for hashing
         reader = generate.Reader(filepaths=filepaths,
                                  piece_size=self.piece_size,
-                                 queue_size=threads*3)
+                                 pool_size=threads*3,
+                                 use_mmap=use_mmap)
 
         # Pool of workers that pull from reader's piece queue, calculate the
         # hashes, and quickly offload the results to a hash queue
-        hasher_threadpool = generate.HasherPool(threads, reader.piece_queue)
+        hasher_threadpool = HasherPool(threads, reader.piece_queue,
+                                       buffer_pool=reader.buffer_pool)
 
         # Pull from the hash queue and call status/cancel callback
         def collector_callback(filepath, pieces_done, piece_index, piece_hash, exc,
@@ -1008,6 +1019,14 @@ class Torrent():
             raise RuntimeError('Unexpected number of hashes generated: '
                                f'{hashes_count} instead of {self.pieces}')
 
+    @staticmethod
+    def _get_hasher_pool(backend):
+        """Return HasherPool class for `backend`"""
+        try:
+            return generate.HASHER_POOLS[backend]
+        except KeyError:
+            raise ValueError(f'Invalid backend: {backend!r}')
+
     def _verify_prepare(self, path, callback, interval):
         """Common tasks of :meth:`verify` and :meth:`verify_filesize`"""
         self.validate()
@@ -1120,7 +1139,7 @@ class Torrent():
             return True
 
     def verify(self, path, skip_file_on_first_error=True, threads=None,
-               callback=None, interval=0):
+               callback=None, interval=0, backend='thread', use_mmap=False):
         """
         Check if `path` contains all the data of this torrent
 
@@ -1151,6 +1170,10 @@ class Torrent():
         :param float interval: Minimum number of seconds between calls to
             `callback` (if 0, `callback` is called once per piece); this is
             ignored if an error is found
+        :param str backend: ``"thread"`` or ``"process"`` (see
+            :meth:`generate`)
+        :param bool use_mmap: Whether to hash slices of memory-mapped files
+            (see :meth:`generate`)
 
         If a callback is specified, exceptions are not raised but passed to
         `callback` instead.
@@ -1158,10 +1181,12 @@ class Torrent():
         :raises VerifyContentError: if a file contains unexpected data
         :raises ReadError: if a file is not readable
         :raises MetainfoError: if :meth:`validate` fails
+        :raises ValueError: if `backend` is not known
 
         :return: ``True`` if `path` is verified successfully, ``False``
             otherwise
         """
+        HasherPool = self._get_hasher_pool(backend)
         raise_exceptions = not callback
         filepaths, maybe_cancel = self._verify_prepare(path, callback, interval=interval)
         fs_filepaths = tuple(x[0] for x in filepaths)
@@ -1181,13 +1206,15 @@ class Torrent():
                                      file_sizes={fs_path:self.partial_size(t_path)
                                                  for fs_path,t_path in filepaths},
                                      piece_size=self.piece_size,
-                                     queue_size=threads*3,
-                                     skip_file_on_first_error=skip_file_on_first_error)
+                                     pool_size=threads*3,
+                                     skip_file_on_first_error=skip_file_on_first_error,
+                                     use_mmap=use_mmap)
 
             # Pool of workers that pull from reader_thread's piece queue, calculate
             # the hashes, and quickly offload the results to a hash queue
-            hasher_threadpool = generate.HasherPool(threads, reader.piece_queue,
-                                                    file_was_skipped=reader.file_was_skipped)
+            hasher_threadpool = HasherPool(threads, reader.piece_queue,
+                                           file_was_skipped=reader.file_was_skipped,
+                                           buffer_pool=reader.buffer_pool)
 
             # Pull from the hash queue; also call `callback` and maybe stop everything
             def collector_callback(filepath, pieces_done, piece_index, piece_hash, exc,
@@ -14,6 +14,7 @@
 
 import os
 import math
+import mmap
 import fnmatch
 from urllib.parse import urlparse
 from urllib.parse import quote_plus as urlquote
@@ -85,6 +86,88 @@ def read_chunks(filepath, chunksize, prepend=bytes()):
     except OSError as e:
         raise error.ReadError(e.errno, filepath)
 
+def read_chunks_into(filepath, chunksize, buffers, prepend=bytes()):
+    """
+    Generator that yields chunks from file that are read into recycled buffers
+
+    `buffers` must provide a `get` method that returns a :class:`bytearray` of
+    `chunksize` bytes and a `put` method that takes it back.  Complete chunks
+    are yielded as the buffer they were read into; whoever consumes them is
+    responsible for passing them to `buffers.put`.  The final chunk is yielded
+    as a copy if it is shorter than `chunksize`.
+
+    `prepend` is prepended to the content of `filepath` and must be shorter than
+    `chunksize`.
+    """
+    assert len(prepend) < chunksize, (len(prepend), chunksize)
+    buf = None
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            buf = buffers.get()
+            view = memoryview(buf)
+            pos = len(prepend)
+            view[:pos] = prepend
+            while True:
+                bytes_read = f.readinto(view[pos:])
+                if not bytes_read:
+                    break  # EOF
+                pos += bytes_read
+                if pos >= chunksize:
+                    # Hand over buffer before yielding so we don't put it
+                    # back if the consumer stops iterating
+                    chunk, buf = buf, None
+                    yield chunk
+                    buf = buffers.get()
+                    view = memoryview(buf)
+                    pos = 0
+            if pos > 0:
+                yield bytes(view[:pos])
+    except OSError as e:
+        raise error.ReadError(e.errno, filepath)
+    finally:
+        if buf is not None:
+            buffers.put(buf)
+
+def read_chunks_mmap(filepath, chunksize, prepend=bytes()):
+    """
+    Generator that yields chunks from memory-mapped file
+
+    Chunks are :class:`memoryview` slices of the mapping.  Only the chunk that
+    combines `prepend` with the first bytes of `filepath` is copied.
+
+    The mapping is unmapped when the last chunk is garbage collected.
+    Truncating `filepath` while chunks are used is fatal (SIGBUS).
+    """
+    chunk = b''
+    for pos in range(0, len(prepend), chunksize):
+        chunk = prepend[pos:pos + chunksize]
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = b''
+    try:
+        with open(filepath, 'rb') as f:
+            filesize = os.fstat(f.fileno()).st_size
+            if filesize <= 0:
+                # Empty files can't be mapped
+                view = memoryview(b'')
+            else:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mapping, 'madvise'):
+                    mapping.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mapping)
+    except OSError as e:
+        raise error.ReadError(e.errno, filepath)
+
+    pos = 0
+    # Fill last chunk from prepended bytes with first bytes from file
+    if chunk:
+        pos = chunksize - len(chunk)
+        chunk = bytes(chunk) + view[:pos]
+        yield chunk
+    while pos < filesize:
+        yield view[pos:pos + chunksize]
+        pos += chunksize
+
 def real_size(path):
     """
     Return size for `path`, which is a (link to a) file or directory